@@ -1,4 +1,5 @@
 from typing import (
+    Callable,
     Iterator,
     Sequence,
     final,
@@ -22,6 +23,21 @@ def slice_len(slc: slice, objlen: int = ...) -> int: ...
 def get_concat_blkno_indexers(
     blknos_list: list[npt.NDArray[np.intp]],
 ) -> list[tuple[npt.NDArray[np.intp], BlockPlacement]]: ...
+def get_concat_blkno_indexers_2d(
+    blknos: npt.NDArray[np.intp],  # 2-D
+) -> list[tuple[npt.NDArray[np.intp], BlockPlacement]]: ...
+def get_concat_plan_indexers(
+    blknos_arr: npt.NDArray[np.intp],  # 2-D
+    blklocs_list: list[npt.NDArray[np.intp]],
+    blk_lens_list: list[npt.NDArray[np.intp]],
+    blk_contig_list: list[npt.NDArray[np.uint8]],
+) -> list[
+    tuple[npt.NDArray[np.intp], BlockPlacement, npt.NDArray[np.intp]]
+]: ...
+def is_uniform_join_units(
+    blocks: list[B],
+    is_na_func: Callable[[B], bool],
+) -> bool: ...
 def get_blkno_indexers(
     blknos: np.ndarray,  # int64_t[:]
     group: bool = ...,
@@ -18,6 +18,7 @@ from numpy cimport (
     int64_t,
     intp_t,
     ndarray,
+    uint8_t,
 )
 
 cnp.import_array()
@@ -496,6 +497,205 @@ def get_concat_blkno_indexers(list blknos_list not None):
     return result
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def get_concat_blkno_indexers_2d(const intp_t[:, :] blknos):
+    """
+    2-D overload of get_concat_blkno_indexers.
+
+    Takes the managers' blknos stacked into a single (n_mgrs, ncols) intp
+    array, so the run detection iterates a typed memoryview instead of
+    dereferencing a Python object per row.
+    """
+    cdef:
+        Py_ssize_t i, j, k, start, ncols, n_mgrs
+        cnp.npy_intp nm
+        ndarray[intp_t] cur_blknos, run_blknos
+        BlockPlacement bp
+        list result = []
+
+    n_mgrs = blknos.shape[0]
+    ncols = blknos.shape[1]
+    if ncols == 0:
+        return []
+
+    nm = n_mgrs
+    cur_blknos = cnp.PyArray_EMPTY(1, &nm, cnp.NPY_INTP, 0)
+    for k in range(n_mgrs):
+        cur_blknos[k] = blknos[k, 0]
+
+    start = 0
+    for i in range(1, ncols):
+        # For each column, we check if the Block it is part of (i.e. blknos[i])
+        #  is the same the previous column (i.e. blknos[i-1]) *and* if this is
+        #  the case for each row.  If not, we start a new "run".
+        for k in range(n_mgrs):
+            if blknos[k, i] != blknos[k, i - 1]:
+                bp = BlockPlacement(slice(start, i))
+                run_blknos = cnp.PyArray_Copy(cur_blknos)
+                result.append((run_blknos, bp))
+
+                start = i
+                for j in range(n_mgrs):
+                    cur_blknos[j] = blknos[j, i]
+                break  # break out of `for k in range(n_mgrs)` loop
+
+    if start != ncols:
+        bp = BlockPlacement(slice(start, ncols))
+        run_blknos = cnp.PyArray_Copy(cur_blknos)
+        result.append((run_blknos, bp))
+    return result
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def get_concat_plan_indexers(
+    ndarray[intp_t, ndim=2] blknos_arr,
+    list blklocs_list not None,
+    list blk_lens_list not None,
+    list blk_contig_list not None,
+):
+    """
+    Extension of get_concat_blkno_indexers that also resolves, for each
+    (run, manager) pair, how the manager's block has to be sliced to get
+    the values for that run.
+
+    Parameters
+    ----------
+    blknos_arr : ndarray[intp, ndim=2]
+        mgr.blknos for each manager, stacked into shape (n_mgrs, ncols).
+    blklocs_list : list of ndarray[intp]
+        mgr.blklocs for each manager.
+    blk_lens_list : list of ndarray[intp]
+        len(blk.mgr_locs) for each block of each manager.
+    blk_contig_list : list of ndarray[uint8]
+        For each block of each manager, 1 if blk.mgr_locs is a step-1
+        slice, else 0.
+
+    Returns
+    -------
+    list of (ndarray[intp], BlockPlacement, ndarray[intp])
+        For each run: the blkno per manager, the BlockPlacement of the run,
+        and an (n_mgrs, 2) array of (start, stop) pairs into the block
+        values.  start == -1 means the run covers the whole block and no
+        slicing is needed; start == -2 means the run's blklocs do not form
+        a step-1 ascending range and the caller has to use the generic
+        take-based path.
+    """
+    cdef:
+        Py_ssize_t i, k, start, stop, blkno, loc0, n_mgrs
+        cnp.npy_intp dims[2]
+        ndarray[intp_t] run_blknos, blklocs, blk_lens
+        ndarray[uint8_t] blk_contig
+        ndarray[intp_t, ndim=2] slice_info
+        BlockPlacement bp
+        bint contig
+        list pairs, result = []
+        tuple pair
+
+    pairs = get_concat_blkno_indexers_2d(blknos_arr)
+    n_mgrs = blknos_arr.shape[0]
+    dims[0] = n_mgrs
+    dims[1] = 2
+
+    for pair in pairs:
+        run_blknos = <ndarray>pair[0]
+        bp = <BlockPlacement>pair[1]
+        # bp was constructed from a non-empty step-1 slice above
+        start = bp._as_slice.start
+        stop = bp._as_slice.stop
+
+        slice_info = cnp.PyArray_EMPTY(2, dims, cnp.NPY_INTP, 0)
+
+        for k in range(n_mgrs):
+            blkno = run_blknos[k]
+            blk_lens = blk_lens_list[k]
+            blk_contig = blk_contig_list[k]
+
+            if stop - start == blk_lens[blkno] and blk_contig[blkno]:
+                # the run covers the whole block
+                slice_info[k, 0] = -1
+                slice_info[k, 1] = -1
+                continue
+
+            blklocs = blklocs_list[k]
+            loc0 = blklocs[start]
+            contig = True
+            for i in range(start + 1, stop):
+                if blklocs[i] != blklocs[i - 1] + 1:
+                    contig = False
+                    break
+
+            if contig:
+                slice_info[k, 0] = loc0
+                slice_info[k, 1] = loc0 + (stop - start)
+            else:
+                slice_info[k, 0] = -2
+                slice_info[k, 1] = -2
+
+        result.append((run_blknos, bp, slice_info))
+
+    return result
+
+
+def is_uniform_join_units(list blocks not None, object is_na_func) -> bool:
+    """
+    Check if the blocks being concatenated are of uniform type such that
+    they can be concatenated using Block.concat_same_type instead of the
+    generic path (which uses `concat_compat`).
+
+    Single-pass replacement for the chained all(...) generators previously
+    in pandas.core.internals.concat._is_uniform_blocks.
+
+    Parameters
+    ----------
+    blocks : list of Block
+    is_na_func : callable
+        Computes whether a block is all-NA; only invoked once the cheap
+        type/dtype checks have passed.
+    """
+    cdef:
+        Py_ssize_t i, n = len(blocks)
+        object first, blk, first_dtype, dtype
+        type first_type
+
+    if n <= 1:
+        # only use this path when there is something to concatenate
+        return False
+
+    first = blocks[0]
+    first_dtype = first.dtype
+    if first_dtype.kind == "V":
+        return False
+    first_type = type(first)
+
+    for i in range(1, n):
+        blk = blocks[i]
+        # exclude cases where a) blk is None or b) we have e.g. Int64+int64
+        if type(blk) is not first_type:
+            return False
+
+        # e.g. DatetimeLikeBlock can be dt64 or td64, but these are not uniform
+        # GH#42092 we only want the dtype_equal check for non-numeric blocks
+        #  (for now, may change but that would need a deprecation)
+        dtype = blk.dtype
+        if dtype is not first_dtype and dtype.kind not in "iub":
+            try:
+                if dtype != first_dtype:
+                    return False
+            except (TypeError, AttributeError):
+                return False
+
+    # no blocks that would get missing values (can lead to type upcasts)
+    # unless we're an extension dtype.
+    for i in range(n):
+        blk = blocks[i]
+        if not blk.is_extension and is_na_func(blk):
+            return False
+
+    return True
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def get_blkno_indexers(
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import itertools
+import os
 from typing import (
     TYPE_CHECKING,
     Sequence,
@@ -14,7 +17,6 @@ from pandas._libs import (
     lib,
 )
 from pandas._libs.missing import NA
-from pandas.util._decorators import cache_readonly
 
 from pandas.core.dtypes.astype import astype_array
 from pandas.core.dtypes.cast import (
@@ -102,8 +104,7 @@ def _concatenate_array_managers(
         # concatting along the rows -> concat the reindexed arrays
         # TODO(ArrayManager) doesn't yet preserve the correct dtype
         arrays = [
-            concat_arrays([mgrs[i].arrays[j] for i in range(len(mgrs))])
-            for j in range(len(mgrs[0].arrays))
+            concat_arrays(list(cols)) for cols in zip(*(mgr.arrays for mgr in mgrs))
         ]
     else:
         # concatting along the columns -> combine reindexed arrays in a single manager
@@ -133,7 +134,9 @@ def concat_arrays(to_concat: list) -> ArrayLike:
     np.ndarray or ExtensionArray
     """
     # ignore the all-NA proxies to determine the resulting dtype
-    to_concat_no_proxy = [x for x in to_concat if not isinstance(x, NullArrayProxy)]
+    is_proxy = [isinstance(x, NullArrayProxy) for x in to_concat]
+    to_concat_no_proxy = [x for x, proxy in zip(to_concat, is_proxy) if not proxy]
+    has_proxy = len(to_concat_no_proxy) != len(to_concat)
 
     dtypes = {x.dtype for x in to_concat_no_proxy}
     single_dtype = len(dtypes) == 1
@@ -144,14 +147,19 @@ def concat_arrays(to_concat: list) -> ArrayLike:
         # GH#42092
         target_dtype = np.find_common_type(list(dtypes), [])
     else:
-        target_dtype = find_common_type([arr.dtype for arr in to_concat_no_proxy])
+        # the deduplicated set is all find_common_type needs; no point
+        #  re-reducing duplicate dtypes
+        target_dtype = find_common_type(list(dtypes))
 
-    to_concat = [
-        arr.to_array(target_dtype)
-        if isinstance(arr, NullArrayProxy)
-        else astype_array(arr, target_dtype, copy=False)
-        for arr in to_concat
-    ]
+    if has_proxy or not single_dtype:
+        to_concat = [
+            arr.to_array(target_dtype)
+            if proxy
+            else astype_array(arr, target_dtype, copy=False)
+            for arr, proxy in zip(to_concat, is_proxy)
+        ]
+    # else: every array already has target_dtype and the astype calls
+    #  would all be no-ops
 
     if isinstance(to_concat[0], ExtensionArray):
         cls = type(to_concat[0])
@@ -200,48 +208,92 @@ def concatenate_managers(
     if concat_axis == 0:
         return _concat_managers_axis0(mgrs_indexers, axes, copy)
 
+    if len(mgrs_indexers) == 1 and not mgrs_indexers[0][1]:
+        # Single manager with nothing to reindex: the result is just the
+        #  input manager, so skip the planning machinery altogether.
+        mgr = mgrs_indexers[0][0]
+        if copy:
+            nbs = [blk.copy() for blk in mgr.blocks]
+        else:
+            # by slicing instead of copy(deep=False), we get a new array
+            #  object, see test_concat_copy
+            nbs = [blk.getitem_block(slice(None)) for blk in mgr.blocks]
+        return BlockManager(tuple(nbs), axes)
+
     mgrs_indexers = _maybe_reindex_columns_na_proxy(axes, mgrs_indexers)
 
     concat_plan = _get_combined_plan([mgr for mgr, _ in mgrs_indexers])
 
     blocks = []
 
-    for placement, join_units in concat_plan:
-        unit = join_units[0]
-        blk = unit.block
+    for placement, blks in concat_plan:
+        blk = blks[0]
 
-        if len(join_units) == 1:
+        if len(blks) == 1:
             values = blk.values
             if copy:
                 values = values.copy()
             else:
                 values = values.view()
             fastpath = True
-        elif _is_uniform_join_units(join_units):
-            vals = [ju.block.values for ju in join_units]
-
-            if not blk.is_extension:
-                # _is_uniform_join_units ensures a single dtype, so
-                #  we can use np.concatenate, which is more performant
-                #  than concat_compat
-                # error: Argument 1 to "concatenate" has incompatible type
-                # "List[Union[ndarray[Any, Any], ExtensionArray]]";
-                # expected "Union[_SupportsArray[dtype[Any]],
-                # _NestedSequence[_SupportsArray[dtype[Any]]]]"
-                values = np.concatenate(vals, axis=1)  # type: ignore[arg-type]
-            elif is_1d_only_ea_dtype(blk.dtype):
-                # TODO(EA2D): special-casing not needed with 2D EAs
-                values = concat_compat(vals, axis=1, ea_compat_axis=True)
-                values = ensure_block_shape(values, ndim=2)
-            else:
-                values = concat_compat(vals, axis=1)
-
-            values = ensure_wrapped_if_datetimelike(values)
-
-            fastpath = blk.values.dtype == values.dtype
         else:
-            values = _concatenate_join_units(join_units, copy=copy)
-            fastpath = False
+            # memoize the all-NA verdicts so that, when the uniform check
+            #  fails, the generic branch below can reuse what it computed
+            is_na_cache: dict[int, bool] = {}
+            is_na_func = partial(_is_na_block_cached, cache=is_na_cache)
+            if libinternals.is_uniform_join_units(blks, is_na_func):
+                vals = [b.values for b in blks]
+
+                if not blk.is_extension:
+                    first = blk.values
+                    if (
+                        len(vals) > 2
+                        # is_extension == False still allows dt64/td64 blocks,
+                        #  whose values are DatetimeArray/TimedeltaArray
+                        and isinstance(first, np.ndarray)
+                        and all(v.dtype == first.dtype for v in vals[1:])
+                    ):
+                        # with many blocks of a single dtype, np.concatenate's
+                        #  per-call setup dominates; preallocating and assigning
+                        #  into slices is cheaper
+                        widths = [v.shape[1] for v in vals]
+                        order = "F" if first.flags.f_contiguous else "C"
+                        values = np.empty(
+                            (first.shape[0], sum(widths)),
+                            dtype=first.dtype,
+                            order=order,
+                        )
+                        offset = 0
+                        for v, width in zip(vals, widths):
+                            values[:, offset : offset + width] = v
+                            offset += width
+                    else:
+                        # is_uniform_join_units allows e.g. int64+int32, for which
+                        #  np.concatenate handles the dtype promotion
+                        # error: Argument 1 to "concatenate" has incompatible type
+                        # "List[Union[ndarray[Any, Any], ExtensionArray]]";
+                        # expected "Union[_SupportsArray[dtype[Any]],
+                        # _NestedSequence[_SupportsArray[dtype[Any]]]]"
+                        values = np.concatenate(vals, axis=1)  # type: ignore[arg-type]
+                elif is_1d_only_ea_dtype(blk.dtype):
+                    # TODO(EA2D): special-casing not needed with 2D EAs
+                    values = concat_compat(vals, axis=1, ea_compat_axis=True)
+                    values = ensure_block_shape(values, ndim=2)
+                else:
+                    values = concat_compat(vals, axis=1)
+
+                values = ensure_wrapped_if_datetimelike(values)
+
+                fastpath = blk.values.dtype == values.dtype
+            else:
+                # Only the generic path needs the JoinUnit wrappers; the
+                #  fastpaths above work on the blocks directly.
+                join_units = [JoinUnit(b) for b in blks]
+                for unit in join_units:
+                    # seed with the verdicts the uniform check computed
+                    unit._is_na = is_na_cache.get(id(unit.block))
+                values = _concatenate_join_units(join_units, copy=copy)
+                fastpath = False
 
         if fastpath:
             b = blk.make_block_same_class(values, placement=placement)
@@ -267,30 +319,43 @@ def _concat_managers_axis0(
 
     mgrs: list[BlockManager] = [x[0] for x in mgrs_indexers]
 
-    offset = 0
-    blocks: list[Block] = []
-    for i, mgr in enumerate(mgrs):
-        # If we already reindexed, then we definitely don't need another copy
-        made_copy = had_reindexers[i]
-
-        for blk in mgr.blocks:
-            if made_copy:
-                nb = blk.copy(deep=False)
-            elif copy:
-                nb = blk.copy()
-            else:
-                # by slicing instead of copy(deep=False), we get a new array
-                #  object, see test_concat_copy
-                nb = blk.getitem_block(slice(None))
-            nb._mgr_locs = nb._mgr_locs.add(offset)
-            blocks.append(nb)
-
-        offset += len(mgr.items)
+    offsets = itertools.accumulate((len(mgr.items) for mgr in mgrs), initial=0)
+    blocks: list[Block] = [
+        _shift_block_axis0(blk, offset, made_copy=had_reindexers[i], copy=copy)
+        for i, (mgr, offset) in enumerate(zip(mgrs, offsets))
+        for blk in mgr.blocks
+    ]
 
     result = BlockManager(tuple(blocks), axes)
     return result
 
 
+def _shift_block_axis0(
+    blk: Block, offset: int, *, made_copy: bool, copy: bool
+) -> Block:
+    """
+    Shallow-copy a block as appropriate for axis=0 concatenation and shift
+    its placement by the given offset.
+    """
+    if made_copy:
+        # If we already reindexed, then we definitely don't need another copy
+        nb = blk.copy(deep=False)
+    elif copy:
+        nb = blk.copy()
+    else:
+        # by slicing instead of copy(deep=False), we get a new array
+        #  object, see test_concat_copy
+        nb = blk.getitem_block(slice(None))
+    nb._mgr_locs = nb._mgr_locs.add(offset)
+    return nb
+
+
+# thresholds below which parallel reindexing in
+#  _maybe_reindex_columns_na_proxy is not worth the thread overhead
+_PARALLEL_REINDEX_MIN_MGRS = 4
+_PARALLEL_REINDEX_MIN_NBYTES = 1 << 20
+
+
 def _maybe_reindex_columns_na_proxy(
     axes: list[Index], mgrs_indexers: list[tuple[BlockManager, dict[int, np.ndarray]]]
 ) -> list[tuple[BlockManager, dict[int, np.ndarray]]]:
@@ -301,47 +366,94 @@ def _maybe_reindex_columns_na_proxy(
     Columns added in this reindexing have dtype=np.void, indicating they
     should be ignored when choosing a column's final dtype.
     """
-    new_mgrs_indexers: list[tuple[BlockManager, dict[int, np.ndarray]]] = []
+    if (
+        len(mgrs_indexers) >= _PARALLEL_REINDEX_MIN_MGRS
+        and any(indexers for _, indexers in mgrs_indexers)
+        and sum(blk.values.nbytes for mgr, _ in mgrs_indexers for blk in mgr.blocks)
+        >= _PARALLEL_REINDEX_MIN_NBYTES
+    ):
+        # The managers are independent and the heavy lifting inside
+        #  reindex_indexer is NumPy take/copy work that releases the GIL,
+        #  so large reindexes can run on a thread pool.
+        func = partial(_reindex_columns_na_proxy_one, axes)
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            # executor.map preserves input order
+            return list(executor.map(func, *zip(*mgrs_indexers)))
+
+    return [
+        _reindex_columns_na_proxy_one(axes, mgr, indexers)
+        for mgr, indexers in mgrs_indexers
+    ]
 
-    for mgr, indexers in mgrs_indexers:
-        # For axis=0 (i.e. columns) we use_na_proxy and only_slice, so this
-        #  is a cheap reindexing.
-        for i, indexer in indexers.items():
-            mgr = mgr.reindex_indexer(
-                axes[i],
-                indexers[i],
-                axis=i,
-                copy=False,
-                only_slice=True,  # only relevant for i==0
-                allow_dups=True,
-                use_na_proxy=True,  # only relevant for i==0
-            )
-        new_mgrs_indexers.append((mgr, {}))
-    return new_mgrs_indexers
+
+def _reindex_columns_na_proxy_one(
+    axes: list[Index], mgr: BlockManager, indexers: dict[int, np.ndarray]
+) -> tuple[BlockManager, dict[int, np.ndarray]]:
+    # For axis=0 (i.e. columns) we use_na_proxy and only_slice, so this
+    #  is a cheap reindexing.
+    for i, indexer in indexers.items():
+        mgr = mgr.reindex_indexer(
+            axes[i],
+            indexers[i],
+            axis=i,
+            copy=False,
+            only_slice=True,  # only relevant for i==0
+            allow_dups=True,
+            use_na_proxy=True,  # only relevant for i==0
+        )
+    return mgr, {}
 
 
 def _get_combined_plan(
     mgrs: list[BlockManager],
-) -> list[tuple[BlockPlacement, list[JoinUnit]]]:
+) -> list[tuple[BlockPlacement, list[Block]]]:
     plan = []
 
     max_len = mgrs[0].shape[0]
 
-    blknos_list = [mgr.blknos for mgr in mgrs]
-    pairs = libinternals.get_concat_blkno_indexers(blknos_list)
-    for ind, (blknos, bp) in enumerate(pairs):
+    # post-reindexing, all managers have the same number of columns, so the
+    #  blknos stack into a single typed 2-D array for libinternals
+    blknos_arr = np.stack([mgr.blknos for mgr in mgrs], axis=0)
+    blklocs_list = [mgr.blklocs for mgr in mgrs]
+    blk_lens_list = [
+        np.array([len(blk.mgr_locs) for blk in mgr.blocks], dtype=np.intp)
+        for mgr in mgrs
+    ]
+    blk_contig_list = [
+        np.array(
+            [
+                blk.mgr_locs.is_slice_like and blk.mgr_locs.as_slice.step == 1
+                for blk in mgr.blocks
+            ],
+            dtype=np.uint8,
+        )
+        for mgr in mgrs
+    ]
+    runs = libinternals.get_concat_plan_indexers(
+        blknos_arr, blklocs_list, blk_lens_list, blk_contig_list
+    )
+    for blknos, bp, slice_info in runs:
         # assert bp.is_slice_like
         # assert len(bp) > 0
 
-        units_for_bp = []
+        blocks_for_bp = []
         for k, mgr in enumerate(mgrs):
             blkno = blknos[k]
+            start = slice_info[k, 0]
+
+            if start == -1:
+                # the run covers the whole block
+                nb = mgr.blocks[blkno]
+            elif start == -2:
+                # non-slice-like blklocs; take the generic path
+                nb = _get_block_for_concat_plan(mgr, bp, blkno, max_len=max_len)
+            else:
+                stop = slice_info[k, 1]
+                nb = mgr.blocks[blkno].getitem_block(slice(int(start), int(stop)))
+            # assert nb.shape == (len(bp), mgr.shape[1])
+            blocks_for_bp.append(nb)
 
-            nb = _get_block_for_concat_plan(mgr, bp, blkno, max_len=max_len)
-            unit = JoinUnit(nb)
-            units_for_bp.append(unit)
-
-        plan.append((bp, units_for_bp))
+        plan.append((bp, blocks_for_bp))
 
     return plan
 
@@ -349,31 +461,37 @@ def _get_combined_plan(
 def _get_block_for_concat_plan(
     mgr: BlockManager, bp: BlockPlacement, blkno: int, *, max_len: int
 ) -> Block:
+    """
+    Fallback for the cases where get_concat_plan_indexers could not resolve
+    the run to a whole block or a step-1 slice; the per-block metadata
+    passed to libinternals already answered the whole-block check, so we go
+    straight to the indexer-based path here.
+    """
     blk = mgr.blocks[blkno]
     # Assertions disabled for performance:
     #  assert bp.is_slice_like
     #  assert blkno != -1
     #  assert (mgr.blknos[bp] == blkno).all()
 
-    if len(bp) == len(blk.mgr_locs) and (
-        blk.mgr_locs.is_slice_like and blk.mgr_locs.as_slice.step == 1
-    ):
-        nb = blk
-    else:
-        ax0_blk_indexer = mgr.blklocs[bp.indexer]
+    ax0_blk_indexer = mgr.blklocs[bp.indexer]
 
-        slc = lib.maybe_indices_to_slice(ax0_blk_indexer, max_len)
-        # TODO: in all extant test cases 2023-04-08 we have a slice here.
-        #  Will this always be the case?
-        nb = blk.getitem_block(slc)
+    slc = lib.maybe_indices_to_slice(ax0_blk_indexer, max_len)
+    # TODO: in all extant test cases 2023-04-08 we have a slice here.
+    #  Will this always be the case?
+    nb = blk.getitem_block(slc)
 
     # assert nb.shape == (len(bp), mgr.shape[1])
     return nb
 
 
 class JoinUnit:
+    # JoinUnits are created in tight loops in _get_combined_plan, so avoid
+    #  the per-instance __dict__
+    __slots__ = ("block", "_is_na")
+
     def __init__(self, block: Block) -> None:
         self.block = block
+        self._is_na: bool | None = None
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({repr(self.block)})"
@@ -392,7 +510,22 @@ class JoinUnit:
 
         if blk.dtype == object:
             values = blk.values
-            return all(is_valid_na_for_dtype(x, dtype) for x in values.ravel(order="K"))
+            # self.is_na above ensured every element satisfies isna, so
+            #  is_valid_na_for_dtype only depends on the element's type; an
+            #  all-NA block holds very few distinct NA types, so memoize the
+            #  verdict per type instead of re-dispatching per element.
+            # values.flat iterates lazily, unlike ravel(order="K") which
+            #  would copy non-contiguous data
+            valid_by_type: dict[type, bool] = {}
+            for x in values.flat:
+                typ = type(x)
+                valid = valid_by_type.get(typ)
+                if valid is None:
+                    valid = is_valid_na_for_dtype(x, dtype)
+                    valid_by_type[typ] = valid
+                if not valid:
+                    return False
+            return True
 
         na_value = blk.fill_value
         if na_value is NaT and not is_dtype_equal(blk.dtype, dtype):
@@ -410,36 +543,17 @@ class JoinUnit:
         # TODO: better to use can_hold_element?
         return is_valid_na_for_dtype(na_value, dtype)
 
-    @cache_readonly
+    @property
     def is_na(self) -> bool:
-        blk = self.block
-        if blk.dtype.kind == "V":
-            return True
-
-        if not blk._can_hold_na:
-            return False
-
-        values = blk.values
-        if values.size == 0:
-            return True
-        if isinstance(values.dtype, SparseDtype):
-            return False
-
-        if values.ndim == 1:
-            # TODO(EA2D): no need for special case with 2D EAs
-            val = values[0]
-            if not is_scalar(val) or not isna(val):
-                # ideally isna_all would do this short-circuiting
-                return False
-            return isna_all(values)
-        else:
-            val = values[0][0]
-            if not is_scalar(val) or not isna(val):
-                # ideally isna_all would do this short-circuiting
-                return False
-            return all(isna_all(row) for row in values)
-
-    def get_reindexed_values(self, empty_dtype: DtypeObj, upcasted_na) -> ArrayLike:
+        # manually cached equivalent of cache_readonly, which requires a
+        #  __dict__ and so does not work with __slots__
+        if self._is_na is None:
+            self._is_na = _is_na_block(self.block)
+        return self._is_na
+
+    def get_reindexed_values(
+        self, empty_dtype: DtypeObj, upcasted_na, *, needs_view: bool = True
+    ) -> ArrayLike:
         values: ArrayLike
 
         if upcasted_na is None and self.block.dtype.kind != "V":
@@ -478,24 +592,86 @@ class JoinUnit:
 
         # If there's no indexing to be done, we want to signal outside
         # code that this array must be copied explicitly.  This is done
-        # by returning a view and checking `retval.base`.
-        values = values.view()
+        # by returning a view and checking `retval.base`.  Callers that are
+        # guaranteed to copy downstream pass needs_view=False to skip the
+        # extra ndarray-header allocation.
+        if needs_view:
+            values = values.view()
         return values
 
 
+def _is_na_block(blk: Block) -> bool:
+    """
+    Check if this block is all-NA, used to decide whether concatenation can
+    ignore its dtype.
+    """
+    if blk.dtype.kind == "V":
+        return True
+
+    if not blk._can_hold_na:
+        return False
+
+    values = blk.values
+    if values.size == 0:
+        return True
+    if isinstance(values.dtype, SparseDtype):
+        return False
+
+    if values.ndim == 1:
+        # TODO(EA2D): no need for special case with 2D EAs
+        val = values[0]
+        if not is_scalar(val) or not isna(val):
+            # ideally isna_all would do this short-circuiting
+            return False
+        return isna_all(values)
+    else:
+        val = values[0][0]
+        if not is_scalar(val) or not isna(val):
+            # ideally isna_all would do this short-circuiting
+            return False
+        if isinstance(values, np.ndarray) and (
+            values.flags.c_contiguous or values.flags.f_contiguous
+        ):
+            # one flattened scan instead of a Python-level loop over rows;
+            #  ravel(order="K") is a zero-copy view for contiguous values
+            return isna_all(values.ravel(order="K"))
+        # for non-contiguous values, raveling would allocate a full copy
+        return all(isna_all(row) for row in values)
+
+
+def _is_na_block_cached(blk: Block, cache: dict[int, bool]) -> bool:
+    """
+    _is_na_block memoized by block identity, so that the uniform check and
+    the generic concatenation branch do not scan the same values twice.
+    """
+    out = cache.get(id(blk))
+    if out is None:
+        out = _is_na_block(blk)
+        cache[id(blk)] = out
+    return out
+
+
 def _concatenate_join_units(join_units: list[JoinUnit], copy: bool) -> ArrayLike:
     """
     Concatenate values from several join units along axis=1.
     """
-    empty_dtype = _get_empty_dtype(join_units)
-
-    has_none_blocks = any(unit.block.dtype.kind == "V" for unit in join_units)
+    empty_dtype, has_none_blocks = _get_empty_dtype(join_units)
     upcasted_na = _dtype_to_na_value(empty_dtype, has_none_blocks)
 
-    to_concat = [
-        ju.get_reindexed_values(empty_dtype=empty_dtype, upcasted_na=upcasted_na)
-        for ju in join_units
-    ]
+    # With more than one unit, concat_compat/np.concatenate below always
+    #  copies, so the base-checking view is only needed in the len-1 case.
+    needs_view = len(join_units) == 1
+    if upcasted_na is None and not has_none_blocks and not needs_view:
+        # with nothing to upcast and no void blocks, get_reindexed_values
+        #  would hand back each block's values unchanged; grab them directly
+        to_concat = [ju.block.values for ju in join_units]
+    else:
+        to_concat = [
+            ju.get_reindexed_values(
+                empty_dtype=empty_dtype, upcasted_na=upcasted_na, needs_view=needs_view
+            )
+            for ju in join_units
+        ]
 
     if len(to_concat) == 1:
         # Only one block, nothing to concatenate.
@@ -509,50 +685,58 @@ def _concatenate_join_units(join_units: list[JoinUnit], copy: bool) -> ArrayLike
             else:
                 concat_values = concat_values.copy()
 
-    elif any(is_1d_only_ea_dtype(t.dtype) for t in to_concat):
-        # TODO(EA2D): special case not needed if all EAs used HybridBlocks
-
-        # error: No overload variant of "__getitem__" of "ExtensionArray" matches
-        # argument type "Tuple[int, slice]"
-        to_concat = [
-            t
-            if is_1d_only_ea_dtype(t.dtype)
-            else t[0, :]  # type: ignore[call-overload]
-            for t in to_concat
-        ]
-        concat_values = concat_compat(to_concat, axis=0, ea_compat_axis=True)
-        concat_values = ensure_block_shape(concat_values, 2)
-
     else:
-        concat_values = concat_compat(to_concat, axis=1)
+        is_1d_only = [is_1d_only_ea_dtype(t.dtype) for t in to_concat]
+        if any(is_1d_only):
+            # TODO(EA2D): special case not needed if all EAs used HybridBlocks
+
+            # error: No overload variant of "__getitem__" of "ExtensionArray" matches
+            # argument type "Tuple[int, slice]"
+            to_concat = [
+                t if t_is_1d else t[0, :]  # type: ignore[call-overload]
+                for t, t_is_1d in zip(to_concat, is_1d_only)
+            ]
+            concat_values = concat_compat(to_concat, axis=0, ea_compat_axis=True)
+            concat_values = ensure_block_shape(concat_values, 2)
+
+        else:
+            concat_values = concat_compat(to_concat, axis=1)
 
     return concat_values
 
 
+# NA value per dtype.kind; checking a dict beats a chain of
+#  string-containment tests on this hot path
+_KIND_TO_NA_VALUE = {
+    "m": lambda dtype: dtype.type("NaT"),
+    "M": lambda dtype: dtype.type("NaT"),
+    "f": lambda dtype: dtype.type("NaN"),
+    "c": lambda dtype: dtype.type("NaN"),
+    # different from missing.na_value_for_dtype
+    "b": lambda dtype: None,
+    "O": lambda dtype: np.nan,
+}
+
+
 def _dtype_to_na_value(dtype: DtypeObj, has_none_blocks: bool):
     """
     Find the NA value to go with this dtype.
     """
     if isinstance(dtype, ExtensionDtype):
         return dtype.na_value
-    elif dtype.kind in "mM":
-        return dtype.type("NaT")
-    elif dtype.kind in "fc":
-        return dtype.type("NaN")
-    elif dtype.kind == "b":
-        # different from missing.na_value_for_dtype
-        return None
-    elif dtype.kind in "iu":
+    kind = dtype.kind
+    if kind in "iu":
         if not has_none_blocks:
             # different from missing.na_value_for_dtype
             return None
         return np.nan
-    elif dtype.kind == "O":
-        return np.nan
-    raise NotImplementedError
+    maker = _KIND_TO_NA_VALUE.get(kind)
+    if maker is None:
+        raise NotImplementedError
+    return maker(dtype)
 
 
-def _get_empty_dtype(join_units: Sequence[JoinUnit]) -> DtypeObj:
+def _get_empty_dtype(join_units: Sequence[JoinUnit]) -> tuple[DtypeObj, bool]:
     """
     Return dtype and N/A values to use when concatenating specified units.
 
@@ -561,56 +745,38 @@ def _get_empty_dtype(join_units: Sequence[JoinUnit]) -> DtypeObj:
     Returns
     -------
     dtype
+    bool
+        Whether any of the units' blocks have dtype.kind == "V", so callers
+        do not have to re-scan the join units for this.
     """
     if len(join_units) == 1:
         blk = join_units[0].block
-        return blk.dtype
-
-    if lib.dtypes_all_equal([ju.block.dtype for ju in join_units]):
-        empty_dtype = join_units[0].block.dtype
-        return empty_dtype
-
-    has_none_blocks = any(unit.block.dtype.kind == "V" for unit in join_units)
-
-    dtypes = [unit.block.dtype for unit in join_units if not unit.is_na]
-    if not len(dtypes):
-        dtypes = [
-            unit.block.dtype for unit in join_units if unit.block.dtype.kind != "V"
-        ]
+        return blk.dtype, blk.dtype.kind == "V"
+
+    blocks = [unit.block for unit in join_units]
+    dtypes = [blk.dtype for blk in blocks]
+
+    # fastpath: all dtypes match, bail out as soon as we see a mismatch
+    #  instead of materializing the full comparison via lib.dtypes_all_equal
+    first_dtype = dtypes[0]
+    all_equal = True
+    for dtype in dtypes[1:]:
+        if dtype is not first_dtype and not is_dtype_equal(dtype, first_dtype):
+            all_equal = False
+            break
+    if all_equal:
+        return first_dtype, first_dtype.kind == "V"
+
+    kinds = [dtype.kind for dtype in dtypes]
+    has_none_blocks = "V" in kinds
+
+    relevant_dtypes = [
+        dtype for dtype, unit in zip(dtypes, join_units) if not unit.is_na
+    ]
+    if not len(relevant_dtypes):
+        relevant_dtypes = [dtype for dtype, kind in zip(dtypes, kinds) if kind != "V"]
 
-    dtype = find_common_type(dtypes)
+    dtype = find_common_type(relevant_dtypes)
     if has_none_blocks:
         dtype = ensure_dtype_can_hold_na(dtype)
-    return dtype
-
-
-def _is_uniform_join_units(join_units: list[JoinUnit]) -> bool:
-    """
-    Check if the join units consist of blocks of uniform type that can
-    be concatenated using Block.concat_same_type instead of the generic
-    _concatenate_join_units (which uses `concat_compat`).
-
-    """
-    first = join_units[0].block
-    if first.dtype.kind == "V":
-        return False
-    return (
-        # exclude cases where a) ju.block is None or b) we have e.g. Int64+int64
-        all(type(ju.block) is type(first) for ju in join_units)
-        and
-        # e.g. DatetimeLikeBlock can be dt64 or td64, but these are not uniform
-        all(
-            is_dtype_equal(ju.block.dtype, first.dtype)
-            # GH#42092 we only want the dtype_equal check for non-numeric blocks
-            #  (for now, may change but that would need a deprecation)
-            or ju.block.dtype.kind in "iub"
-            for ju in join_units
-        )
-        and
-        # no blocks that would get missing values (can lead to type upcasts)
-        # unless we're an extension dtype.
-        all(not ju.is_na or ju.block.is_extension for ju in join_units)
-        and
-        # only use this path when there is something to concatenate
-        len(join_units) > 1
-    )
+    return dtype, has_none_blocks
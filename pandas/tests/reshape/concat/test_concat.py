@@ -802,3 +802,45 @@ def test_concat_mismatched_keys_length():
         concat((x for x in sers), keys=(y for y in keys), axis=1)
     with tm.assert_produces_warning(FutureWarning, match=msg):
         concat((x for x in sers), keys=(y for y in keys), axis=0)
+
+
+@td.skip_array_manager_invalid_test
+def test_concat_parallel_reindex_matches_serial(monkeypatch):
+    # exercise the ThreadPoolExecutor branch of
+    # _maybe_reindex_columns_na_proxy, which the default thresholds reserve
+    # for >= 4 managers carrying more than 1 MiB of block data
+    from pandas.core.internals import concat as internals_concat
+
+    df1 = DataFrame(
+        np.arange(30, dtype=np.float64).reshape(10, 3), columns=["a", "b", "c"]
+    )
+    df2 = DataFrame(
+        np.arange(40, dtype=np.float64).reshape(10, 4), columns=["b", "c", "d", "e"]
+    )
+
+    cases = [
+        # misaligned columns
+        [df1, df2, df1, df2],
+        # duplicated managers sharing the same blocks
+        [df1, df1, df1, df2],
+    ]
+    for frames in cases:
+        expected = concat(frames)
+
+        with monkeypatch.context() as m:
+            m.setattr(internals_concat, "_PARALLEL_REINDEX_MIN_MGRS", 2)
+            m.setattr(internals_concat, "_PARALLEL_REINDEX_MIN_NBYTES", 0)
+
+            pool_calls = []
+
+            class RecordingExecutor(internals_concat.ThreadPoolExecutor):
+                def map(self, fn, *iterables, **kwargs):
+                    pool_calls.append(fn)
+                    return super().map(fn, *iterables, **kwargs)
+
+            m.setattr(internals_concat, "ThreadPoolExecutor", RecordingExecutor)
+            result = concat(frames)
+
+        # the threaded branch must actually have been taken
+        assert pool_calls
+        tm.assert_frame_equal(result, expected)
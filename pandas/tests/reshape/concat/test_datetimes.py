@@ -527,6 +527,19 @@ def test_concat_timedelta64_block():
     tm.assert_frame_equal(result.iloc[10:], df)
 
 
+def test_concat_datetimelike_block_many_frames():
+    # dt64/td64 blocks are not extension blocks but hold
+    #  DatetimeArray/TimedeltaArray values; make sure the uniform-dtype
+    #  fastpath with 3+ managers handles them
+    dti = date_range("1/1/2000", periods=3)
+    tdi = to_timedelta(np.arange(3), unit="s")
+    df = DataFrame({"t": dti, "td": tdi})
+
+    result = concat([df, df, df], ignore_index=True)
+    expected = DataFrame({"t": list(dti) * 3, "td": list(tdi) * 3})
+    tm.assert_frame_equal(result, expected)
+
+
 def test_concat_multiindex_datetime_nat():
     # GH#44900
     left = DataFrame({"a": 1}, index=MultiIndex.from_tuples([(1, pd.NaT)]))